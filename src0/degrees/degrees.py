@@ -0,0 +1,293 @@
+import csv
+import sys
+
+from array import array
+
+# Maps names to a frozenset of corresponding person_ids
+names = {}
+
+# Maps person_ids to compact integer indices, and indices back to person_ids
+person_idx = {}
+person_ids = []
+
+# Maps movie_ids to compact integer indices, and indices back to movie_ids
+movie_idx = {}
+movie_ids = []
+
+# Names and births of people, and titles of movies, by index
+person_names = []
+person_births = []
+movie_titles = []
+
+# Adjacency in compressed sparse row form: the movies of person i are
+# person_movie_indices[person_movie_offsets[i]:person_movie_offsets[i + 1]],
+# and the stars of movie j are laid out the same way in movie_star_indices
+person_movie_offsets = array("i")
+person_movie_indices = array("i")
+movie_star_offsets = array("i")
+movie_star_indices = array("i")
+
+
+def load_data(directory):
+    """
+    Load data from CSV files into memory.
+    """
+    # Indices are handed out by position, so start every table empty
+    # in case data was loaded before
+    for table in (names, person_idx, movie_idx):
+        table.clear()
+    for table in (person_ids, movie_ids, person_names, person_births,
+                  movie_titles, person_movie_offsets, person_movie_indices,
+                  movie_star_offsets, movie_star_indices):
+        del table[:]
+
+    person_movies = []
+    movie_stars = []
+
+    # Load people. csv.reader yields an empty row for a blank line, which
+    # each loop filters out before unpacking
+    with open(f"{directory}/people.csv", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for person_id, name, birth in filter(None, reader):
+            person_idx[person_id] = len(person_ids)
+            person_ids.append(person_id)
+            person_names.append(name)
+            person_births.append(birth)
+            person_movies.append([])
+            names.setdefault(name.lower(), set()).add(person_id)
+
+    # Load movies
+    with open(f"{directory}/movies.csv", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for movie_id, title, year in filter(None, reader):
+            movie_idx[movie_id] = len(movie_ids)
+            movie_ids.append(movie_id)
+            movie_titles.append(title)
+            movie_stars.append([])
+
+    # Load stars, skipping rows for unknown people or movies. Repeated
+    # rows are kept, since the search already skips anyone it has reached
+    with open(f"{directory}/stars.csv", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for person_id, movie_id in filter(None, reader):
+            person = person_idx.get(person_id)
+            movie = movie_idx.get(movie_id)
+            if person is None or movie is None:
+                continue
+            person_movies[person].append(movie)
+            movie_stars[movie].append(person)
+
+    # Pack adjacency lists into contiguous arrays
+    fill_csr(person_movies, person_movie_offsets, person_movie_indices)
+    fill_csr(movie_stars, movie_star_offsets, movie_star_indices)
+
+    # Nothing is added to names once loading is done, so freeze its sets
+    for name, ids in names.items():
+        names[name] = frozenset(ids)
+
+
+def fill_csr(lists, offsets, indices):
+    """
+    Appends a list of index lists to offsets and indices
+    in compressed sparse row form.
+    """
+    offsets.append(len(indices))
+    for items in lists:
+        indices.extend(items)
+        offsets.append(len(indices))
+
+
+def main():
+    if len(sys.argv) > 2:
+        sys.exit("Usage: python degrees.py [directory]")
+    directory = sys.argv[1] if len(sys.argv) == 2 else "large"
+
+    # Load data from files into memory
+    print("Loading data...")
+    load_data(directory)
+    print("Data loaded.")
+
+    source = person_id_for_name(input("Name: "))
+    if source is None:
+        sys.exit("Person not found.")
+    target = person_id_for_name(input("Name: "))
+    if target is None:
+        sys.exit("Person not found.")
+
+    source = person_idx[source]
+    path = shortest_index_path(source, person_idx[target])
+
+    if path is None:
+        print("Not connected.")
+    else:
+        degrees = len(path)
+        print(f"{degrees} degrees of separation.")
+        path = [(None, source)] + path
+        for i in range(degrees):
+            person1 = person_names[path[i][1]]
+            person2 = person_names[path[i + 1][1]]
+            movie = movie_titles[path[i + 1][0]]
+            print(f"{i + 1}: {person1} and {person2} starred in {movie}")
+
+
+def shortest_path(source, target):
+    """
+    Returns the shortest list of (movie_id, person_id) pairs
+    that connect the source to the target.
+
+    If no possible path, returns None.
+    """
+    path = shortest_index_path(person_idx[source], person_idx[target])
+    if path is None:
+        return None
+    return [(movie_ids[movie], person_ids[person]) for movie, person in path]
+
+
+def shortest_index_path(source, target):
+    """
+    Returns the shortest list of (movie, person) index pairs
+    that connect the source index to the target index.
+
+    If no possible path, returns None.
+    """
+    if source == target:
+        return []
+
+    # Someone who starred in nothing has no neighbors, so there is no
+    # need to set up a search at all
+    for person in (source, target):
+        if person_movie_offsets[person] == person_movie_offsets[person + 1]:
+            return None
+
+    found = bfs_csr(source, target)
+    if found is None:
+        return None
+    parent_person, parent_movie, forward, movie, backward = found
+
+    path = []
+    person = forward
+    while person != source:
+        path.append((parent_movie[person], person))
+        person = parent_person[person]
+    path.reverse()
+
+    # People reached from the target point back towards it, so walking
+    # up from backward visits the rest of the path in order
+    path.append((movie, backward))
+    person = backward
+    while person != target:
+        path.append((parent_movie[person], parent_person[person]))
+        person = parent_person[person]
+
+    return path
+
+
+def bfs_csr(source, target):
+    """
+    Runs a bidirectional breadth-first search between two distinct
+    person indices over the CSR adjacency arrays.
+
+    Returns (parent_person, parent_movie, forward, movie, backward),
+    where forward was reached from the source and backward from the
+    target and both starred in movie, or None if there is no path.
+    parent_person and parent_movie give, for every person reached,
+    the person and movie it was reached through.
+    """
+    # side marks which search reached each person: 1 from the source,
+    # 2 from the target. Everyone is queued at most once, so each search
+    # only appends to its queue and a head index stands in for popping.
+    # The queues are plain lists and the parents are dicts keyed by the
+    # people reached, so both grow with the work done rather than costing
+    # a full allocation per person on every search
+    side = bytearray(len(person_ids))
+    parent_person = {}
+    parent_movie = {}
+    queues = ([source], [target])
+    heads = [0, 0]
+    side[source] = 1
+    side[target] = 2
+
+    while heads[0] < len(queues[0]) and heads[1] < len(queues[1]):
+        # Grow whichever search has the smaller frontier by a whole level
+        if len(queues[0]) - heads[0] <= len(queues[1]) - heads[1]:
+            k = 0
+        else:
+            k = 1
+        current = k + 1
+        other = 2 - k
+        queue = queues[k]
+        level_end = len(queue)
+
+        for i in range(heads[k], level_end):
+            node = queue[i]
+            start = person_movie_offsets[node]
+            end = person_movie_offsets[node + 1]
+            for movie in person_movie_indices[start:end]:
+                first = movie_star_offsets[movie]
+                last = movie_star_offsets[movie + 1]
+                for person in movie_star_indices[first:last]:
+                    if side[person] == other:
+                        if k == 0:
+                            forward, backward = node, person
+                        else:
+                            forward, backward = person, node
+                        return (parent_person, parent_movie,
+                                forward, movie, backward)
+                    if not side[person]:
+                        side[person] = current
+                        parent_person[person] = node
+                        parent_movie[person] = movie
+                        queue.append(person)
+
+        heads[k] = level_end
+
+    return None
+
+
+def person_id_for_name(name):
+    """
+    Returns the IMDB id for a person's name,
+    resolving ambiguities as needed.
+    """
+    ids = names.get(name.lower())
+    if not ids:
+        return None
+    elif len(ids) == 1:
+        return next(iter(ids))
+
+    print(f"Which '{name}'?")
+    for person_id in ids:
+        person = person_idx[person_id]
+        name = person_names[person]
+        birth = person_births[person]
+        print(f"ID: {person_id}, Name: {name}, Birth: {birth}")
+    try:
+        person_id = input("Intended Person ID: ")
+        if person_id in ids:
+            return person_id
+    except ValueError:
+        pass
+    return None
+
+
+def neighbors_for_person(person):
+    """
+    Yields (movie, person) index pairs for people
+    who starred with a given person index.
+
+    A pair comes out more than once if stars.csv repeats its row.
+    """
+    start = person_movie_offsets[person]
+    end = person_movie_offsets[person + 1]
+    for movie in person_movie_indices[start:end]:
+        first = movie_star_offsets[movie]
+        last = movie_star_offsets[movie + 1]
+        for costar in movie_star_indices[first:last]:
+            yield movie, costar
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Tic Tac Toe Player
+"""
+
+import math
+
+from functools import lru_cache
+
+X = "X"
+O = "O"
+EMPTY = None
+
+# The search works on a state of two 9-bit integers (x, o), one per
+# player, where cell (i, j) is bit 3 * i + j
+FULL = 0o777
+
+# Bit masks of the three rows, three columns and two diagonals
+LINES = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+
+# Cells to try first: the center, then corners, then edges, so that
+# strong moves come early and alpha-beta pruning cuts in sooner
+MOVE_ORDER = tuple(1 << i for i in (4, 0, 2, 6, 8, 1, 3, 5, 7))
+
+
+def initial_state():
+    """
+    Returns starting state of the board.
+    """
+    return [[EMPTY, EMPTY, EMPTY],
+            [EMPTY, EMPTY, EMPTY],
+            [EMPTY, EMPTY, EMPTY]]
+
+
+def player(board):
+    """
+    Returns player who has the next turn on a board.
+    """
+    return bb_player(bitboards(board))
+
+
+def actions(board):
+    """
+    Returns set of all possible actions (i, j) available on the board.
+    """
+    return {cell(bit) for bit in bb_actions(bitboards(board))}
+
+
+def result(board, action):
+    """
+    Returns the board that results from making move (i, j) on the board.
+    """
+    i, j = action
+    if not (0 <= i < 3 and 0 <= j < 3) or board[i][j] is not EMPTY:
+        raise Exception("invalid action")
+    new_board = [row[:] for row in board]
+    new_board[i][j] = player(board)
+    return new_board
+
+
+def winner(board):
+    """
+    Returns the winner of the game, if there is one.
+    """
+    return bb_winner(bitboards(board))
+
+
+def terminal(board):
+    """
+    Returns True if game is over, False otherwise.
+    """
+    return bb_terminal(bitboards(board))
+
+
+def utility(board):
+    """
+    Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
+    """
+    return bb_utility(bitboards(board))
+
+
+def minimax(board):
+    """
+    Returns the optimal action for the current player on the board.
+    """
+    state = bitboards(board)
+    if bb_evaluate(state) is not None:
+        return None
+
+    best_action = None
+    if bb_player(state) == X:
+        best = -math.inf
+        for bit in bb_actions(state):
+            value = min_value(bb_result(state, bit, X), best, math.inf)
+            if value > best:
+                best, best_action = value, bit
+    else:
+        best = math.inf
+        for bit in bb_actions(state):
+            value = max_value(bb_result(state, bit, O), -math.inf, best)
+            if value < best:
+                best, best_action = value, bit
+    return cell(best_action)
+
+
+@lru_cache(maxsize=None)
+def max_value(state, alpha, beta):
+    """
+    Returns the value of a state with X to move, pruning
+    once the value can no longer fall between alpha and beta.
+
+    Values are cached, since many move orders reach the same state.
+    """
+    score = bb_evaluate(state)
+    if score is not None:
+        return score
+    value = -math.inf
+    for bit in bb_actions(state):
+        value = max(value, min_value(bb_result(state, bit, X), alpha, beta))
+        if value >= beta:
+            return value
+        alpha = max(alpha, value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def min_value(state, alpha, beta):
+    """
+    Returns the value of a state with O to move, pruning
+    once the value can no longer fall between alpha and beta.
+
+    Values are cached, since many move orders reach the same state.
+    """
+    score = bb_evaluate(state)
+    if score is not None:
+        return score
+    value = math.inf
+    for bit in bb_actions(state):
+        value = min(value, max_value(bb_result(state, bit, O), alpha, beta))
+        if value <= alpha:
+            return value
+        beta = min(beta, value)
+    return value
+
+
+def bitboards(board):
+    """
+    Returns the (x, o) state for a board.
+    """
+    x = o = 0
+    for i, row in enumerate(board):
+        for j, mark in enumerate(row):
+            if mark == X:
+                x |= 1 << (3 * i + j)
+            elif mark == O:
+                o |= 1 << (3 * i + j)
+    return x, o
+
+
+def cell(bit):
+    """
+    Returns the (i, j) cell for a single-bit mask.
+    """
+    return divmod(bit.bit_length() - 1, 3)
+
+
+def bb_player(state):
+    """
+    Returns player who has the next turn in a state.
+    """
+    x, o = state
+    return X if bin(x).count("1") == bin(o).count("1") else O
+
+
+def bb_actions(state):
+    """
+    Yields a single-bit mask for each empty cell in a state,
+    in MOVE_ORDER.
+    """
+    x, o = state
+    taken = x | o
+    for bit in MOVE_ORDER:
+        if not taken & bit:
+            yield bit
+
+
+def bb_result(state, bit, turn):
+    """
+    Returns the state that results from player turn taking a cell.
+    """
+    x, o = state
+    if turn == X:
+        return x | bit, o
+    return x, o | bit
+
+
+def bb_winner(state):
+    """
+    Returns the winner in a state, if there is one.
+    """
+    x, o = state
+    for line in LINES:
+        if x & line == line:
+            return X
+        if o & line == line:
+            return O
+    return None
+
+
+def bb_terminal(state):
+    """
+    Returns True if the game is over in a state, False otherwise.
+    """
+    return bb_evaluate(state) is not None
+
+
+def bb_utility(state):
+    """
+    Returns 1 if X has won in a state, -1 if O has won, 0 otherwise.
+    """
+    return bb_evaluate(state) or 0
+
+
+def bb_evaluate(state):
+    """
+    Returns the utility of a state if the game is over, None otherwise.
+
+    This finds the winner once, where checking bb_terminal and then
+    bb_utility at a leaf would look for it twice.
+    """
+    w = bb_winner(state)
+    if w == X:
+        return 1
+    elif w == O:
+        return -1
+    x, o = state
+    return 0 if x | o == FULL else None